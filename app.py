@@ -1,22 +1,156 @@
-# streamlit_app.py
+# app.py — single app module; streamlit_app.py is a thin entrypoint shim.
 import os
+import re
 import json
+import heapq
+import asyncio
+from collections import deque
+from itertools import islice
 from datetime import datetime
 import streamlit as st
 from dotenv import load_dotenv
 
 # Attempt to import new OpenAI client; if not available, we'll still run in demo mode.
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
 except Exception:
     OpenAI = None
+    AsyncOpenAI = None
+
+# Optional fast multi-keyword matcher; falls back to compiled regex if missing.
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+
+# Optional fast JSON parser for model payloads; stdlib json is the fallback.
+try:
+    import orjson as _fast_json
+except ImportError:
+    try:
+        import ujson as _fast_json
+    except ImportError:
+        _fast_json = None
+
+# ---------------- Symptom keyword tables ----------------
+# category -> keywords used by the local analyzer. Matching is done in a single
+# pass over the text (Aho-Corasick automaton, or one compiled alternation per
+# category) instead of one substring scan per keyword.
+_SYMPTOM_KEYWORDS = {
+    "breathing": ("shortness of breath", "breathless", "difficulty breathing", "cant breathe"),
+    "chest": ("chest pain", "pressure in chest", "tightness in chest"),
+    "cold": ("sore throat", "runny nose", "sneezing", "stuffy nose", "nasal congestion"),
+    "flu": ("body ache", "body aches", "high fever", "chills", "fatigue"),
+    "allergy": ("itchy eyes", "itchy", "watery eyes", "seasonal", "pollen", "sneezing"),
+    "gi": ("nausea", "vomit", "vomiting", "diarrhea", "abdominal pain"),
+    "fever": ("fever",),
+    "mild_fever": ("low fever", "mild fever"),
+}
+
+if ahocorasick is not None:
+    _keyword_cats = {}
+    for _cat, _kws in _SYMPTOM_KEYWORDS.items():
+        for _kw in _kws:
+            _keyword_cats.setdefault(_kw, set()).add(_cat)
+    _SYMPTOM_AUTOMATON = ahocorasick.Automaton()
+    for _kw, _cats in _keyword_cats.items():
+        _SYMPTOM_AUTOMATON.add_word(_kw, frozenset(_cats))
+    _SYMPTOM_AUTOMATON.make_automaton()
+
+    def _match_symptom_categories(text: str):
+        hits = set()
+        for _, cats in _SYMPTOM_AUTOMATON.iter(text):
+            hits |= cats
+        return hits
+else:
+    _SYMPTOM_PATTERNS = {
+        cat: re.compile("|".join(map(re.escape, kws)))
+        for cat, kws in _SYMPTOM_KEYWORDS.items()
+    }
+    # first-letter sieve: one pass over the text collects which keyword
+    # initials occur, letting us skip whole categories without a regex search
+    _CATEGORY_PREFIXES = {
+        cat: frozenset(kw[0] for kw in kws)
+        for cat, kws in _SYMPTOM_KEYWORDS.items()
+    }
+    _PREFIX_CHARS = frozenset(c for s in _CATEGORY_PREFIXES.values() for c in s)
+
+    def _match_symptom_categories(text: str):
+        present = {ch for ch in text if ch in _PREFIX_CHARS}
+        return {
+            cat for cat, pat in _SYMPTOM_PATTERNS.items()
+            if _CATEGORY_PREFIXES[cat] & present and pat.search(text)
+        }
+
+# Static rules as (category, name, rationale, confidence, urgency) tuples;
+# dicts are only materialized for the final top-3 selection.
+_CONDITION_RULES = (
+    ("breathing", "Acute respiratory distress / serious respiratory issue", "Presence of breathing difficulty is a red flag requiring urgent evaluation.", 0.9, "high"),
+    ("chest", "Cardiac or chest emergency (angina / myocardial infarction)", "Chest pain can indicate a heart-related emergency; immediate attention advised.", 0.95, "high"),
+    ("cold", "Common cold (viral upper respiratory infection)", "Upper airway symptoms like runny nose and sore throat without high fever commonly indicate a viral cold.", 0.65, "low"),
+    ("flu", "Influenza (flu)", "Fever combined with body aches and fatigue suggests influenza-like illness.", 0.55, "medium"),
+    ("allergy", "Allergic rhinitis (allergy)", "Itchy/watery eyes and sneezing without fever suggests allergy.", 0.45, "low"),
+    ("gi", "Gastrointestinal infection / gastroenteritis", "GI symptoms like vomiting or diarrhea suggest a gastrointestinal infection or upset.", 0.5, "medium"),
+)
+
+# prebuilt result dicts, one per rule — the hot path never constructs dicts
+_RULE_RESULTS = tuple(
+    {"name": name, "rationale": rationale, "confidence": confidence, "urgency": urgency}
+    for _, name, rationale, confidence, urgency in _CONDITION_RULES
+)
+
+# extra gating for categories that depend on fever context; everything else
+# is a plain membership test on the hits set
+_RULE_GUARDS = {
+    "cold": '"cold" in hits and ("fever" not in hits or "mild_fever" in hits)',
+    "flu": '"flu" in hits and "fever" in hits',
+    "allergy": '"allergy" in hits and "fever" not in hits',
+}
+
+def _build_rule_matcher():
+    """
+    Generate a matcher specialized to _CONDITION_RULES at import time.
+    Partial evaluation unrolls the rule loop into straight-line membership
+    tests that append the prebuilt result dicts — no per-call iteration,
+    tuple unpacking or dict construction.
+    """
+    lines = ["def _match_rules(hits):", "    out = []"]
+    for idx, rule in enumerate(_CONDITION_RULES):
+        cond = _RULE_GUARDS.get(rule[0], f'"{rule[0]}" in hits')
+        lines.append(f"    if {cond}: out.append(_RULE_RESULTS[{idx}])")
+    lines.append("    return out")
+    namespace = {"_RULE_RESULTS": _RULE_RESULTS}
+    exec("\n".join(lines), namespace)
+    return namespace["_match_rules"]
+
+_match_rules = _build_rule_matcher()
+
+# conservative generic set used when nothing matched
+_FALLBACK_CONDITIONS = (
+    {"name": "Viral infection (unspecified)", "rationale": "Symptoms could be due to a viral infection; more specific details would help.", "confidence": 0.5, "urgency": "low"},
+    {"name": "Allergic or inflammatory cause", "rationale": "Consider allergies or inflammation depending on triggers and timing.", "confidence": 0.2, "urgency": "low"},
+    {"name": "Further assessment recommended", "rationale": "If symptoms worsen or red flags appear, seek clinical evaluation.", "confidence": 0.15, "urgency": "medium"},
+)
+
+_NEXT_STEPS = (
+    "If any red flag is present (difficulty breathing, chest pain, fainting, severe bleeding), seek emergency care immediately.",
+    "For mild symptoms: rest, hydration, OTC analgesics if needed, monitor symptoms for 48–72 hours.",
+    "If symptoms worsen or persist beyond 7 days (or new severe symptoms appear), consult a healthcare provider.",
+)
+
+_DISCLAIMER = "This is for educational purposes only and not a medical diagnosis. Consult a qualified healthcare professional for medical advice."
 
 # ---------------- CONFIG ----------------
-st.set_page_config(page_title="AI Healthcare Symptom Checker", layout="wide", page_icon="🩺")
-load_dotenv()
+@st.cache_resource
+def _load_env():
+    """Read .env once per process instead of on every script rerun."""
+    load_dotenv()
+    return os.getenv("OPENAI_API_KEY", "")
 
 # ---------------- UI CSS ----------------
-st.markdown("""
+# Built once at import; Streamlit reruns the whole script per interaction, so
+# everything static lives at module scope instead of being rebuilt each time.
+_CSS = """
     <style>
         .title { color: #2563eb; font-size: 2.1rem; font-weight:700; }
         .subtitle { color: #444; margin-bottom: 1rem; }
@@ -25,31 +159,109 @@ st.markdown("""
         .urgent { background:#ffebee; padding:10px; border-radius:8px; border:1px solid #f8c1c0; color:#b71c1c; }
         .footer { color:#777; text-align:center; margin-top:18px; font-size:0.9rem; }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def _inject_css():
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+_URGENCY_COLOR = {"low": "#16a34a", "medium": "#f59e0b", "high": "#ef4444"}
+
+# condition-card markup defined once; the render loop is just format_map+join
+_CARD_TEMPLATE = (
+    "<div class='condition-card'>"
+    "<b>{name}</b><br>"
+    "<small><b>Confidence:</b> {confidence:.2f}  —  <b>Urgency:</b> "
+    "<span style='color:{color}'>{urgency_cap}</span></small>"
+    "<p><b>Rationale:</b> {rationale}</p>"
+    "</div>"
+)
+
+def _card_fields(c):
+    """Pull card fields out of a condition dict once, with safe defaults."""
+    urgency = str(c.get("urgency", "low")).lower()
+    return {
+        "name": c.get("name"),
+        "rationale": c.get("rationale"),
+        "confidence": c.get("confidence", 0),
+        "color": _URGENCY_COLOR.get(urgency, "#6b7280"),
+        "urgency_cap": urgency.capitalize(),
+    }
 
-# ---------------- Title ----------------
-st.markdown("<div class='title'>🩺 Healthcare Symptom Checker</div>", unsafe_allow_html=True)
-st.markdown("<div class='subtitle'>Educational demo — suggests possible causes & next steps. Not a diagnosis.</div>", unsafe_allow_html=True)
+# Stream partial model output while waiting; JSON is only parsed once the
+# final chunk has arrived, so this is purely a perceived-latency win.
+_USE_STREAMING = True
+
+_DEMO_TEXT = "Sore throat, runny nose for 3 days, mild fever 100.4°F, tiredness"
+
+_PROMPT_TEMPLATE = """
+You are an educational medical assistant. The user gave these symptoms:
+\"\"\"{symptoms}\"\"\"
+
+1) Provide top 3 possible conditions (non-diagnostic) with name, rationale, confidence 0-1, urgency (low/medium/high).
+2) Provide 3 next steps and urgent red-flag instructions.
+3) Return ONLY valid JSON with keys: conditions, next_steps, disclaimer.
+"""
+
+_SYSTEM_MESSAGE = {"role": "system", "content": "You are a conservative, safety-first medical assistant for educational purposes."}
+
+# JSON extraction from model output: try a direct raw_decode from the first
+# "{" (single C-level parse, no regex) and only fall back to the precompiled
+# DOTALL pattern for messy output.
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+def _extract_json(text: str):
+    """Return the first JSON object embedded in `text`, or None."""
+    i = text.find("{")
+    if i < 0:
+        return None
+    # fastest path: C-extension parse of the outermost {...} span
+    j = text.rfind("}")
+    if _fast_json is not None and j > i:
+        try:
+            return _fast_json.loads(text[i:j + 1])
+        except ValueError:
+            pass
+    try:
+        obj, _ = _JSON_DECODER.raw_decode(text, i)
+        return obj
+    except ValueError:
+        m = _JSON_RE.search(text)
+        if m:
+            try:
+                return json.loads(m.group(0))
+            except ValueError:
+                pass
+    return None
 
 # ---------------- OpenAI client setup ----------------
 # Option A: hardcode key (only for local/demonstration; don't commit to git)
 # OPENAI_KEY = "sk-REPLACE_WITH_YOUR_KEY"   # <-- you can uncomment and paste your key here temporarily
 
 # Option B: use environment / .env
-OPENAI_KEY = os.getenv("OPENAI_API_KEY", "")  # if empty -> demo mode
+OPENAI_KEY = _load_env()  # if empty -> demo mode
 
-client = None
-if OPENAI_KEY and OpenAI is not None:
+@st.cache_resource
+def _get_client():
+    """Construct the OpenAI client once per process; reruns reuse it."""
+    if not OPENAI_KEY or OpenAI is None:
+        return None
     try:
-        client = OpenAI(api_key=OPENAI_KEY)
+        return OpenAI(api_key=OPENAI_KEY)
     except Exception:
-        client = None
+        return None
+
+client = _get_client()
 
 # ---------------- Helper: robust wrapper ----------------
+@st.cache_data(ttl=3600, show_spinner=False)
 def call_openai_chat(messages, model="gpt-4o", temperature=0.2, max_tokens=700):
     """
     Safely call OpenAI v2 client if available. Returns the model text (string).
     If client missing or call fails, raises an exception.
+    Results are memoized per (messages, model, ...) so Streamlit reruns with
+    the same symptoms don't re-hit the API.
     """
     if client is None:
         raise RuntimeError("OpenAI client not available")
@@ -57,145 +269,239 @@ def call_openai_chat(messages, model="gpt-4o", temperature=0.2, max_tokens=700):
         model=model,
         messages=messages,
         temperature=temperature,
-        max_tokens=max_tokens
+        max_tokens=max_tokens,
+        n=1
     )
     return resp.choices[0].message.content.strip()
 
+def call_openai_chat_stream(messages, model="gpt-4o", temperature=0.2, max_tokens=700):
+    """
+    Streaming variant of call_openai_chat: shows partial output in a
+    placeholder as chunks arrive (much better time-to-first-token), then
+    returns the full text so JSON extraction still sees the whole payload.
+    The final text is memoized per session, so streaming only happens on a
+    cache miss — identical reruns return instantly without re-hitting the API.
+    """
+    if client is None:
+        raise RuntimeError("OpenAI client not available")
+    memo = st.session_state.setdefault("_stream_memo", {})
+    key = (model, temperature, max_tokens, json.dumps(messages, sort_keys=True))
+    if key in memo:
+        return memo[key]
+    resp = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        n=1,
+        stream=True
+    )
+    placeholder = st.empty()
+    buf = []
+    for chunk in resp:
+        delta = chunk.choices[0].delta.content or ""
+        if delta:
+            buf.append(delta)
+            # update every few chunks to keep frontend traffic low
+            if len(buf) % 8 == 0:
+                placeholder.markdown("".join(buf))
+    placeholder.empty()
+    text = "".join(buf).strip()
+    memo[key] = text
+    # keep the memo small: evict oldest entries FIFO-style
+    while len(memo) > 32:
+        memo.pop(next(iter(memo)))
+    return text
+
+async def _analyze_many_async(texts, model="gpt-4o", temperature=0.2, max_tokens=700):
+    """
+    Analyze several symptom strings with concurrent API calls: all requests
+    are in flight at once, so the wall-clock cost is ~one round trip instead
+    of one per text. Used for batch re-analysis (e.g. saved history).
+    """
+    if AsyncOpenAI is None or not OPENAI_KEY:
+        raise RuntimeError("OpenAI async client not available")
+    # cap in-flight requests so large batches stay within RPM limits
+    sem = asyncio.Semaphore(10)
+    async with AsyncOpenAI(api_key=OPENAI_KEY) as aclient:
+        async def _one(text):
+            async with sem:
+                resp = await aclient.chat.completions.create(
+                    model=model,
+                    messages=[_SYSTEM_MESSAGE, {"role": "user", "content": _PROMPT_TEMPLATE.format(symptoms=text)}],
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    n=1
+                )
+                return resp.choices[0].message.content.strip()
+        return await asyncio.gather(*(_one(t) for t in texts))
+
+def analyze_many(texts):
+    """Synchronous front for _analyze_many_async; returns a list of model texts."""
+    return asyncio.run(_analyze_many_async(list(texts)))
+
 # ---------------- Fallback: deterministic local analyzer (no API key needed) ----------------
+@st.cache_data(ttl=86400, show_spinner=False)
+def _analyze_cached(text: str):
+    """Cached core of the local analyzer; `text` is already lowercased/stripped."""
+    # one linear scan of the text collects every matched category, then the
+    # generated straight-line matcher maps categories to prebuilt results
+    hits = _match_symptom_categories(text)
+    matched = _match_rules(hits)
+    # if no conditions found, give a conservative generic set
+    if not matched:
+        matched = list(_FALLBACK_CONDITIONS)
+    # trim to top 3 by confidence (partial selection, no full sort)
+    conditions = heapq.nlargest(3, matched, key=lambda c: c["confidence"])
+
+    return {"conditions": conditions, "next_steps": list(_NEXT_STEPS),
+            "disclaimer": _DISCLAIMER}
+
 def local_symptom_analyzer(symptoms_text: str):
     """
     Deterministic rule-based analysis that produces structured JSON:
     - top 3 conditions with rationale, confidence, urgency
     - next_steps list
     This is educational-only placeholder output for demo purposes.
+    The heavy lifting is memoized on the normalized symptom text, so reruns
+    with the same input skip the keyword scan entirely.
     """
-    text = symptoms_text.lower()
-    conditions = []
-    # simple heuristics, ordered by priority
-    if any(k in text for k in ["shortness of breath", "breathless", "difficulty breathing", "cant breathe"]):
-        conditions.append({"name":"Acute respiratory distress / serious respiratory issue", "rationale":"Presence of breathing difficulty is a red flag requiring urgent evaluation.","confidence":0.9,"urgency":"high"})
-    if any(k in text for k in ["chest pain", "pressure in chest", "tightness in chest"]):
-        conditions.append({"name":"Cardiac or chest emergency (angina / myocardial infarction)", "rationale":"Chest pain can indicate a heart-related emergency; immediate attention advised.","confidence":0.95,"urgency":"high"})
-    # common cold / viral upper respiratory
-    if any(k in text for k in ["sore throat", "runny nose", "sneezing", "stuffy nose", "nasal congestion"]) and ("fever" not in text or "low fever" in text or "mild fever" in text):
-        conditions.append({"name":"Common cold (viral upper respiratory infection)", "rationale":"Upper airway symptoms like runny nose and sore throat without high fever commonly indicate a viral cold.","confidence":0.65,"urgency":"low"})
-    # influenza
-    if "fever" in text and any(k in text for k in ["body ache", "body aches", "high fever", "chills", "fatigue"]) :
-        conditions.append({"name":"Influenza (flu)", "rationale":"Fever combined with body aches and fatigue suggests influenza-like illness.","confidence":0.55,"urgency":"medium"})
-    # allergy
-    if any(k in text for k in ["itchy eyes", "itchy", "watery eyes", "seasonal", "pollen", "sneezing"]) and "fever" not in text:
-        conditions.append({"name":"Allergic rhinitis (allergy)", "rationale":"Itchy/watery eyes and sneezing without fever suggests allergy.","confidence":0.45,"urgency":"low"})
-    # gastrointestinal
-    if any(k in text for k in ["nausea", "vomit", "vomiting", "diarrhea", "abdominal pain"]):
-        conditions.append({"name":"Gastrointestinal infection / gastroenteritis", "rationale":"GI symptoms like vomiting or diarrhea suggest a gastrointestinal infection or upset.","confidence":0.5,"urgency":"medium"})
-    # if no conditions found, give a conservative generic set
-    if not conditions:
-        conditions = [
-            {"name":"Viral infection (unspecified)", "rationale":"Symptoms could be due to a viral infection; more specific details would help.", "confidence":0.5, "urgency":"low"},
-            {"name":"Allergic or inflammatory cause", "rationale":"Consider allergies or inflammation depending on triggers and timing.", "confidence":0.2, "urgency":"low"},
-            {"name":"Further assessment recommended", "rationale":"If symptoms worsen or red flags appear, seek clinical evaluation.", "confidence":0.15, "urgency":"medium"},
-        ]
-    # trim to top 3 by confidence
-    conditions = sorted(conditions, key=lambda x: x["confidence"], reverse=True)[:3]
-
-    # Construct next steps conservatively
-    next_steps = [
-        "If any red flag is present (difficulty breathing, chest pain, fainting, severe bleeding), seek emergency care immediately.",
-        "For mild symptoms: rest, hydration, OTC analgesics if needed, monitor symptoms for 48–72 hours.",
-        "If symptoms worsen or persist beyond 7 days (or new severe symptoms appear), consult a healthcare provider."
-    ]
-
-    return {"conditions": conditions, "next_steps": next_steps,
-            "disclaimer": "This is for educational purposes only and not a medical diagnosis. Consult a qualified healthcare professional for medical advice."}
+    return _analyze_cached(symptoms_text.lower().strip())
 
 # ---------------- Main app UI ----------------
-col1, col2 = st.columns([2, 1])
+# Each panel is an st.fragment: its own button clicks rerun just that island
+# instead of re-executing the whole script (client setup, CSS, layout).
 
-with col1:
+@st.fragment
+def _analyze_panel():
+    # consume the demo prefill before the widget is instantiated
+    if st.session_state.pop("demo_prefill", False):
+        st.session_state["symptoms_input"] = _DEMO_TEXT
     symptoms = st.text_area("Describe your symptoms (include duration, severity, red flags):", height=180,
-                            placeholder="e.g. sore throat, runny nose for 3 days, mild fever 100°F, no shortness of breath")
+                            placeholder="e.g. sore throat, runny nose for 3 days, mild fever 100°F, no shortness of breath",
+                            key="symptoms_input")
     st.write("Tip: include duration, severity, and any major medical history (asthma, heart disease).")
+    # share with the history panel without forcing a full-script rerun
+    st.session_state["last_symptoms"] = symptoms
 
     submitted = st.button("Analyze symptoms")
     demo_btn = st.button("Use demo example")
 
-with col2:
+    # Demo example convenience: prefill via session_state and rerun only this
+    # fragment — no deprecated experimental_rerun, no full-script double render
+    if demo_btn:
+        st.session_state["demo_prefill"] = True
+        st.rerun(scope="fragment")
+
+    if submitted:
+        if not symptoms.strip():
+            st.error("Please enter symptoms first.")
+        else:
+            with st.spinner("Generating analysis..."):
+                # If we have a client and a key, try to use real model safely
+                result = None
+                if client is not None:
+                    try:
+                        # Careful system+user prompt that requests JSON
+                        messages = [
+                            _SYSTEM_MESSAGE,
+                            {"role": "user", "content": _PROMPT_TEMPLATE.format(symptoms=symptoms)}
+                        ]
+                        if _USE_STREAMING:
+                            text = call_openai_chat_stream(messages, model="gpt-4o")
+                        else:
+                            text = call_openai_chat(messages, model="gpt-4o")
+                        # attempt to parse JSON out of output
+                        parsed = _extract_json(text)
+                        if parsed is not None:
+                            result = parsed
+                        else:
+                            # not JSON -> fallback to raw text packaged
+                            result = {"raw": text}
+                    except Exception as e:
+                        # if any error calling live API, fallback to local deterministic analysis
+                        result = {"note": f"OpenAI call failed: {str(e)}", **local_symptom_analyzer(symptoms)}
+                else:
+                    # no API key/client -> use local deterministic analyzer
+                    result = local_symptom_analyzer(symptoms)
+
+            # Display results
+            if "raw" in result:
+                st.warning("Model returned non-JSON text; showing raw output.")
+                st.text(result["raw"])
+            else:
+                st.subheader("Possible conditions (educational only)")
+                # all cards through the precompiled template, one markdown call
+                st.markdown("\n".join(
+                    _CARD_TEMPLATE.format_map(_card_fields(c)) for c in result["conditions"]
+                ), unsafe_allow_html=True)
+
+                st.subheader("Recommended next steps")
+                st.markdown("\n\n".join("• " + step for step in result["next_steps"]))
+
+                st.markdown(f"<div class='disclaimer'>{result.get('disclaimer')}</div>", unsafe_allow_html=True)
+
+@st.fragment
+def _history_panel():
     st.markdown("### History")
+    # bounded: old entries are evicted automatically, no slice copies per rerun
     if "history" not in st.session_state:
-        st.session_state["history"] = []
+        st.session_state["history"] = deque(maxlen=50)
     if st.button("Save last query"):
+        symptoms = st.session_state.get("last_symptoms", "")
         if symptoms.strip():
-            st.session_state.history.append({"time": datetime.now().isoformat(), "symptoms": symptoms})
+            now = datetime.now().isoformat()
+            # pre-split the timestamp once at insert so rendering is a plain lookup
+            st.session_state.history.append({"date": now[:10], "hms": now[11:19], "symptoms": symptoms})
             st.success("Saved to history.")
         else:
             st.info("No symptoms to save.")
     st.write("Recent:")
-    for h in reversed(st.session_state.history[-6:]):
-        st.write(f"- {h['time'].split('T')[0]} {h['time'].split('T')[1][:8]}: {h['symptoms'][:80]}")
-
-# Demo example convenience
-if demo_btn:
-    symptoms = "Sore throat, runny nose for 3 days, mild fever 100.4°F, tiredness"
-    st.experimental_rerun()
-
-if submitted:
-    if not symptoms.strip():
-        st.error("Please enter symptoms first.")
-    else:
-        with st.spinner("Generating analysis..."):
-            # If we have a client and a key, try to use real model safely
-            result = None
-            if client is not None:
-                try:
-                    # Build a careful system+user prompt that requests JSON
-                    prompt = f"""
-You are an educational medical assistant. The user gave these symptoms:
-\"\"\"{symptoms}\"\"\"
+    recent = "\n".join(
+        f"- {h['date']} {h['hms']}: {h['symptoms'][:80]}"
+        for h in islice(reversed(st.session_state.history), 6)
+    )
+    if recent:
+        st.write(recent)
+    if st.button("Analyze all saved symptoms"):
+        entries = list(st.session_state.history)
+        if not entries:
+            st.info("History is empty.")
+        else:
+            texts = [h["symptoms"] for h in entries]
+            with st.spinner("Analyzing saved symptoms..."):
+                if client is not None:
+                    try:
+                        # all requests in flight at once: ~one round trip total
+                        results = [_extract_json(t) or {"raw": t} for t in analyze_many(texts)]
+                    except Exception as e:
+                        # mirror the single-query fallback: say the API failed
+                        # so local heuristics aren't mistaken for model output
+                        st.warning(f"OpenAI batch call failed: {e} — showing local analysis.")
+                        results = [local_symptom_analyzer(t) for t in texts]
+                else:
+                    results = [local_symptom_analyzer(t) for t in texts]
+            summary = []
+            for h, r in zip(entries, results):
+                conditions = r.get("conditions") or [{}]
+                top = conditions[0].get("name", "see raw output")
+                summary.append(f"- {h['symptoms'][:60]}: **{top}**")
+            st.markdown("\n".join(summary))
 
-1) Provide top 3 possible conditions (non-diagnostic) with name, rationale, confidence 0-1, urgency (low/medium/high).
-2) Provide 3 next steps and urgent red-flag instructions.
-3) Return ONLY valid JSON with keys: conditions, next_steps, disclaimer.
-"""
-                    messages = [
-                        {"role": "system", "content": "You are a conservative, safety-first medical assistant for educational purposes."},
-                        {"role": "user", "content": prompt}
-                    ]
-                    text = call_openai_chat(messages, model="gpt-4o")
-                    # attempt to parse JSON out of output
-                    import re
-                    m = re.search(r"(\{.*\})", text, re.DOTALL)
-                    if m:
-                        result = json.loads(m.group(1))
-                    else:
-                        # not JSON -> fallback to raw text packaged
-                        result = {"raw": text}
-                except Exception as e:
-                    # if any error calling live API, fallback to local deterministic analysis
-                    result = {"note": f"OpenAI call failed: {str(e)}", **local_symptom_analyzer(symptoms)}
-            else:
-                # no API key/client -> use local deterministic analyzer
-                result = local_symptom_analyzer(symptoms)
+def main():
+    st.set_page_config(page_title="AI Healthcare Symptom Checker", layout="wide", page_icon="🩺")
+    _inject_css()
 
-        # Display results
-        if "raw" in result:
-            st.warning("Model returned non-JSON text; showing raw output.")
-            st.text(result["raw"])
-        else:
-            st.subheader("Possible conditions (educational only)")
-            for c in result["conditions"]:
-                color = {"low":"#16a34a","medium":"#f59e0b","high":"#ef4444"}.get(c.get("urgency","low").lower(),"#6b7280")
-                st.markdown(f"""
-                <div class='condition-card'>
-                  <b>{c.get('name')}</b><br>
-                  <small><b>Confidence:</b> {c.get('confidence',0):.2f}  —  <b>Urgency:</b> <span style='color:{color}'>{c.get('urgency','low').capitalize()}</span></small>
-                  <p><b>Rationale:</b> {c.get('rationale')}</p>
-                </div>
-                """, unsafe_allow_html=True)
-
-            st.subheader("Recommended next steps")
-            for step in result["next_steps"]:
-                st.write("• " + step)
-
-            st.markdown(f"<div class='disclaimer'>{result.get('disclaimer')}</div>", unsafe_allow_html=True)
-
-st.markdown("<div class='footer'>© 2025 Healthcare Symptom Checker — Educational demo - Developed by Charan</div>", unsafe_allow_html=True)
+    st.markdown("<div class='title'>🩺 Healthcare Symptom Checker</div>", unsafe_allow_html=True)
+    st.markdown("<div class='subtitle'>Educational demo — suggests possible causes & next steps. Not a diagnosis.</div>", unsafe_allow_html=True)
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        _analyze_panel()
+    with col2:
+        _history_panel()
+
+    st.markdown("<div class='footer'>© 2025 Healthcare Symptom Checker — Educational demo - Developed by Charan</div>", unsafe_allow_html=True)
+
+if __name__ == "__main__":
+    main()